@@ -15,7 +15,32 @@ Usage:
     neo_by_name = db.get_neo_by_name("Eros")
     neo_by_designation = db.get_neo_by_designation("433")
     hazardous_approaches = db.query(filters=[HazardousFilter(operator.eq, True)])
+    close_approaches = db.query_vectorized(distance_max=0.025, hazardous=True)
 """
+from array import array
+from bisect import bisect_left, bisect_right
+import operator
+
+from filters import create_filters
+
+
+def _chain_filters(filters):
+    """Combine a sequence of filters into one predicate that `and`s them in order.
+
+    With no filters, the predicate accepts every close approach.
+
+    The predicate's source is generated to call each filter inline, which avoids
+    setting up an `all()` over a generator expression for every close approach.
+    """
+    if not filters:
+        return lambda approach: True
+    if len(filters) == 1:
+        return filters[0]
+    names = [f'f{i}' for i in range(len(filters))]
+    namespace = dict(zip(names, filters))
+    exec(f"def predicate(approach): return {' and '.join(f'{name}(approach)' for name in names)}", namespace)
+    return namespace['predicate']
+
 
 class NEODatabase:
     """A database of near-Earth objects and their close approaches.
@@ -38,10 +63,14 @@ class NEODatabase:
         # Link NEOs and their close approaches
         for approach in approaches:
             neo = self._designation_index.get(approach._designation)
-            if neo:
+            if neo is not None:
                 approach.neo = neo
                 neo.approaches.append(approach)
 
+        # The sorted date index for `query_vectorized`, built on its first use
+        self._date = None
+        self._date_order = None
+
     def get_neo_by_designation(self, designation):
         """Find and return an NEO by its primary designation."""
         return self._designation_index.get(designation)
@@ -51,7 +80,80 @@ class NEODatabase:
         return self._name_index.get(name)
 
     def query(self, filters=()):
-        """Query close approaches to generate those that match a collection of filters."""
-        for approach in self._approaches:
-            if all(f(approach) for f in filters):
-                yield approach
+        """Query close approaches to generate those that match a collection of filters.
+
+        The filters are evaluated in the order given and stop at the first one that
+        rejects an approach, so cheap and selective filters should come first, as
+        they do from `create_filters`.
+        """
+        filters = tuple(filters)
+        if not filters:
+            yield from self._approaches
+            return
+
+        yield from filter(_chain_filters(filters), self._approaches)
+
+    def _build_date_index(self):
+        """Sort the approaches' date ordinals so that a date range can be found by bisection.
+
+        `self._date` holds the ordinals in sorted order, and the permutation
+        `self._date_order` maps each of its positions back to an index in
+        `self._approaches`.
+        """
+        dates = [approach._date_ord for approach in self._approaches]
+        self._date_order = array('l', sorted(range(len(dates)), key=dates.__getitem__))
+        self._date = array('l', (dates[i] for i in self._date_order))
+
+    def query_vectorized(
+            self, date=None, start_date=None, end_date=None,
+            distance_min=None, distance_max=None,
+            velocity_min=None, velocity_max=None,
+            diameter_min=None, diameter_max=None,
+            hazardous=None
+    ):
+        """Query close approaches, using the sorted date column to skip straight to a date range.
+
+        This accepts the same criteria as `create_filters` and matches the same
+        close approaches as `query`, but produces them sorted by date (approaches
+        on the same date keep their relative order) rather than in the order the
+        database was given them. The date criteria are collapsed into a single
+        [lo, hi] range, which is found by bisecting the sorted date column, and
+        conflicting bounds short-circuit the whole query. The remaining criteria
+        are then checked in a single pass over just that slice, with one chained
+        predicate per close approach. Without any date criteria there is nothing
+        to bisect, so every approach is scanned and only the matches are sorted.
+
+        The sorted date index is built on the first date-bounded call, so that
+        databases which never use this method don't pay for it.
+        """
+        inf = float('inf')
+
+        date_lo, date_hi = -inf, inf
+        if date:
+            date_lo = date_hi = date.toordinal()
+        if start_date:
+            date_lo = max(date_lo, start_date.toordinal())
+        if end_date:
+            date_hi = min(date_hi, end_date.toordinal())
+
+        bounds = ((velocity_min, velocity_max), (distance_min, distance_max), (diameter_min, diameter_max))
+        if date_lo > date_hi or any(lo and hi and lo > hi for lo, hi in bounds):
+            return
+
+        filters = create_filters(
+            distance_min=distance_min, distance_max=distance_max,
+            velocity_min=velocity_min, velocity_max=velocity_max,
+            diameter_min=diameter_min, diameter_max=diameter_max,
+            hazardous=hazardous
+        )
+        predicate = _chain_filters(filters)
+        if date_lo == -inf and date_hi == inf:
+            # Without a date range there is nothing to bisect, so scan everything
+            # and sort just the matches, which `sorted` keeps stable within a date.
+            yield from sorted(filter(predicate, self._approaches), key=operator.attrgetter('_date_ord'))
+            return
+
+        if self._date is None:
+            self._build_date_index()
+        window = self._date_order[bisect_left(self._date, date_lo):bisect_right(self._date, date_hi)]
+        yield from filter(predicate, map(self._approaches.__getitem__, window))
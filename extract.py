@@ -15,8 +15,14 @@ Usage:
 """
 
 import csv
-import json
+from sys import intern
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+from helpers import cd_to_datetime
 from models import NearEarthObject, CloseApproach
 
 def load_neos(neo_csv_path):
@@ -29,17 +35,17 @@ def load_neos(neo_csv_path):
     :param neo_csv_path: A path to a CSV file containing data about near-Earth objects.
     :return: A list of `NearEarthObject` instances.
     """
-    neos = []
-
-    with open(neo_csv_path, 'r') as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            designation = row['pdes']
-            name = row['name'] if row['name'] else None
-            diameter = float(row['diameter']) if row['diameter'] else float('nan')
-            hazardous = row['pha'] == 'Y'
-            neo = NearEarthObject(designation=designation, name=name, diameter=diameter, hazardous=hazardous)
-            neos.append(neo)
+    with open(neo_csv_path, 'r', newline='') as file:
+        reader = csv.reader(file)
+        header = next(reader)
+        i_pdes, i_name, i_diameter, i_pha = (header.index(key) for key in ('pdes', 'name', 'diameter', 'pha'))
+        neos = [
+            NearEarthObject(designation=intern(row[i_pdes]),
+                            name=row[i_name] or None,
+                            diameter=row[i_diameter],
+                            hazardous=row[i_pha] == 'Y')
+            for row in reader
+        ]
 
     return neos
 
@@ -55,16 +61,18 @@ def load_approaches(cad_json_path):
     """
     approaches = []
 
-    with open(cad_json_path, 'r') as file:
-        data = json.load(file)
-        for approach_data in data['data']:
-            approach_info = dict(zip(data['fields'], approach_data))
-            
-            designation = approach_info['des']
-            time = approach_info['cd']
-            distance = float(approach_info['dist'])
-            velocity = float(approach_info['v_rel'])
-            approach = CloseApproach(designation=designation, time=time, distance=distance, velocity=velocity)
-            approaches.append(approach)
+    with open(cad_json_path, 'rb') as file:
+        data = json_loads(file.read())
+
+    fields = data['fields']
+    i_des = fields.index('des')
+    i_cd = fields.index('cd')
+    i_dist = fields.index('dist')
+    i_v = fields.index('v_rel')
+
+    for row in data['data']:
+        approach = CloseApproach(designation=intern(row[i_des]), time=cd_to_datetime(row[i_cd]),
+                                 distance=float(row[i_dist]), velocity=float(row[i_v]))
+        approaches.append(approach)
 
     return approaches
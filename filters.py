@@ -1,7 +1,7 @@
 """
 Module for filtering close approaches based on various attributes.
 
-This module provides a set of filters to apply on close approaches of near-Earth objects (NEOs). Each filter is represented as a class that can be invoked to determine if a given close approach matches the filter criteria. The module supports filtering by date, distance, velocity, diameter, and hazardous status of the NEO.
+This module provides a set of filters to apply on close approaches of near-Earth objects (NEOs). Each filter is represented as a class that can be invoked to determine if a given close approach matches the filter criteria. `create_filters` builds specialized predicates with the `make_*` factories instead, which skip the class's `get` and `op` indirection on every call. The module supports filtering by date, distance, velocity, diameter, and hazardous status of the NEO.
 
 Typical usage involves creating a set of filters using the `create_filters` function and then applying these filters to a collection of close approaches.
 
@@ -9,6 +9,7 @@ Example:
     filters = create_filters(date=date(2020, 1, 1), hazardous=True)
     filtered_approaches = [approach for approach in approaches if all(f(approach) for f in filters)]
 """
+from itertools import islice
 import operator
 
 class UnsupportedCriterionError(NotImplementedError):
@@ -46,7 +47,8 @@ class AttributeFilter:
         """
         Fetch the attribute of interest from the given close approach.
 
-        This method should be overridden by subclasses to get the specific attribute they filter.
+        This method should be overridden by subclasses to get the specific attribute they filter,
+        usually with a C-level `operator.attrgetter` wrapped in `staticmethod`.
 
         :param approach: A `CloseApproach` to fetch the attribute from.
         :return: The value of the attribute of interest.
@@ -60,42 +62,96 @@ class AttributeFilter:
 class DateFilter(AttributeFilter):
     """Filter close approaches based on the date of approach."""
 
-    @classmethod
-    def get(cls, approach):
-        """Fetch the date of the close approach."""
-        return approach.time.date()
+    def __init__(self, op, value):
+        """
+        Initialize a new DateFilter.
+
+        The reference date's ordinal is also kept, so that each evaluation is an integer comparison.
+
+        :param op: A binary predicate comparator (e.g., operator.le).
+        :param value: The reference `date` to compare against.
+        """
+        super().__init__(op, value)
+        self.ordinal = value.toordinal()
+
+    def __call__(self, approach):
+        """
+        Evaluate the filter on a given close approach.
+
+        :param approach: A `CloseApproach` to evaluate.
+        :return: True if the close approach matches the filter, False otherwise.
+        """
+        return self.op(self.get(approach), self.ordinal)
+
+    # Fetch the date ordinal of the close approach.
+    get = staticmethod(operator.attrgetter('_date_ord'))
 
 class DistanceFilter(AttributeFilter):
     """Filter close approaches based on the distance of approach."""
 
-    @classmethod
-    def get(cls, approach):
-        """Fetch the distance of the close approach."""
-        return approach.distance
+    # Fetch the distance of the close approach.
+    get = staticmethod(operator.attrgetter('distance'))
 
 class VelocityFilter(AttributeFilter):
     """Filter close approaches based on the velocity of approach."""
-    
-    @classmethod
-    def get(cls, approach):
-        """Fetch the velocity of the close approach."""
-        return approach.velocity
+
+    # Fetch the velocity of the close approach.
+    get = staticmethod(operator.attrgetter('velocity'))
 
 class DiameterFilter(AttributeFilter):
     """Filter close approaches based on the diameter of the NEO."""
 
-    @classmethod
-    def get(cls, approach):
-        """Fetch the diameter of the NEO associated with the close approach."""
-        return approach.neo.diameter
+    # Fetch the diameter of the NEO associated with the close approach.
+    get = staticmethod(operator.attrgetter('neo.diameter'))
 
 class HazardousFilter(AttributeFilter):
     """Filter close approaches based on the hazardous status of the NEO."""
-    
-    @classmethod
-    def get(cls, approach):
-        """Fetch the hazardous status of the NEO associated with the close approach."""
-        return approach.neo.hazardous
+
+    # Fetch the hazardous status of the NEO associated with the close approach.
+    get = staticmethod(operator.attrgetter('neo.hazardous'))
+
+def make_date_eq(value):
+    """Return a predicate matching close approaches on the given date."""
+    ordinal = value.toordinal()
+    return lambda approach: approach._date_ord == ordinal
+
+def make_date_ge(value):
+    """Return a predicate matching close approaches on or after the given date."""
+    ordinal = value.toordinal()
+    return lambda approach: approach._date_ord >= ordinal
+
+def make_date_le(value):
+    """Return a predicate matching close approaches on or before the given date."""
+    ordinal = value.toordinal()
+    return lambda approach: approach._date_ord <= ordinal
+
+def make_distance_ge(value):
+    """Return a predicate matching close approaches at least the given distance away."""
+    return lambda approach: approach.distance >= value
+
+def make_distance_le(value):
+    """Return a predicate matching close approaches at most the given distance away."""
+    return lambda approach: approach.distance <= value
+
+def make_velocity_ge(value):
+    """Return a predicate matching close approaches at least the given velocity."""
+    return lambda approach: approach.velocity >= value
+
+def make_velocity_le(value):
+    """Return a predicate matching close approaches at most the given velocity."""
+    return lambda approach: approach.velocity <= value
+
+def make_diameter_ge(value):
+    """Return a predicate matching close approaches of NEOs at least the given diameter."""
+    return lambda approach: approach.neo.diameter >= value
+
+def make_diameter_le(value):
+    """Return a predicate matching close approaches of NEOs at most the given diameter."""
+    return lambda approach: approach.neo.diameter <= value
+
+def make_hazardous_eq(value):
+    """Return a predicate matching close approaches of NEOs with the given hazardous status."""
+    return lambda approach: approach.neo.hazardous == value
 
 def create_filters(
         date=None, start_date=None, end_date=None,
@@ -117,30 +173,33 @@ def create_filters(
     :param diameter_min: Minimum diameter of the NEO for filtering close approaches.
     :param diameter_max: Maximum diameter of the NEO for filtering close approaches.
     :param hazardous: Hazardous status of the NEO for filtering close approaches.
-    :return: A tuple of filters for use with querying close approaches.
+    :return: A tuple of filters for use with querying close approaches, cheapest first.
     """
     filters = []
 
+    # The predicates are appended cheapest and most selective first, because
+    # `NEODatabase.query` evaluates them in this order. The diameter predicates
+    # go last since they have to go through the approach's NEO.
+    if hazardous is not None:
+        filters.append(make_hazardous_eq(hazardous))
     if date:
-        filters.append(DateFilter(operator.eq, date))
+        filters.append(make_date_eq(date))
     if start_date:
-        filters.append(DateFilter(operator.ge, start_date))
+        filters.append(make_date_ge(start_date))
     if end_date:
-        filters.append(DateFilter(operator.le, end_date))
-    if distance_min:
-        filters.append(DistanceFilter(operator.ge, distance_min))
-    if distance_max:
-        filters.append(DistanceFilter(operator.le, distance_max))
+        filters.append(make_date_le(end_date))
     if velocity_min:
-        filters.append(VelocityFilter(operator.ge, velocity_min))
+        filters.append(make_velocity_ge(velocity_min))
     if velocity_max:
-        filters.append(VelocityFilter(operator.le, velocity_max))
+        filters.append(make_velocity_le(velocity_max))
+    if distance_min:
+        filters.append(make_distance_ge(distance_min))
+    if distance_max:
+        filters.append(make_distance_le(distance_max))
     if diameter_min:
-        filters.append(DiameterFilter(operator.ge, diameter_min))
+        filters.append(make_diameter_ge(diameter_min))
     if diameter_max:
-        filters.append(DiameterFilter(operator.le, diameter_max))
-    if hazardous is not None:
-        filters.append(HazardousFilter(operator.eq, hazardous))
+        filters.append(make_diameter_le(diameter_max))
 
     return tuple(filters)
 
@@ -148,10 +207,12 @@ def limit(iterator, n=None):
     """
     Limit the number of items produced from an iterator.
 
+    A limit of `None` or 0 means no limit.
+
     :param iterator: An iterator of values.
     :param n: The maximum number of values to produce.
     :return: An iterator producing at most `n` values.
     """
-    if n:
-        return (item for _, item in zip(range(n), iterator))
-    return iterator
\ No newline at end of file
+    if not n:
+        return iterator
+    return islice(iterator, n)
@@ -12,6 +12,11 @@ provide that level of resolution, so the output format also will not.
 """
 import datetime
 
+_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12,
+}
+
 
 def cd_to_datetime(calendar_date):
     """Convert a NASA-formatted calendar date/time description into a datetime.
@@ -26,6 +31,17 @@ def cd_to_datetime(calendar_date):
     :param calendar_date: A calendar date in YYYY-bb-DD hh:mm format.
     :return: A naive `datetime` corresponding to the given calendar date and time.
     """
+    # Build the datetime directly from the fixed-width fields, which is several
+    # times faster than `strptime`. Anything that isn't exactly YYYY-bbb-DD hh:mm
+    # goes through `strptime`, which raises the usual `ValueError`.
+    try:
+        year, month, rest = calendar_date.split('-')
+        if (len(year) == 4 and year.isdigit() and len(rest) == 8
+                and rest[:2].isdigit() and rest[2] == ' '
+                and rest[3:5].isdigit() and rest[5] == ':' and rest[6:].isdigit()):
+            return datetime.datetime(int(year), _MONTHS[month], int(rest[:2]), int(rest[3:5]), int(rest[6:]))
+    except (AttributeError, KeyError, ValueError):
+        pass
     return datetime.datetime.strptime(calendar_date, "%Y-%b-%d %H:%M")
 
 
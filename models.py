@@ -15,8 +15,13 @@ Typical usage:
     neo.approaches.append(approach)
 """
 
+import datetime
+
 from helpers import cd_to_datetime, datetime_to_str
 
+# Shared by every NEO without a known diameter, rather than building a new NaN each time
+_NAN = float('nan')
+
 class NearEarthObject:
     """
     Represents a near-Earth object (NEO) with its properties and close approaches.
@@ -25,18 +30,21 @@ class NearEarthObject:
     This class encapsulates the semantic and physical parameters of the NEO, such as its designation, name, diameter, and potential hazard status.
     """
 
-    def __init__(self, designation='', name=None, diameter=float('nan'), hazardous=False):
+    __slots__ = ('designation', 'name', 'diameter', 'hazardous', 'approaches')
+
+    def __init__(self, designation='', name=None, diameter=_NAN, hazardous=False):
         """
         Initialize a new NearEarthObject.
 
         :param designation: The unique identifier for this NEO.
         :param name: The IAU name for this NEO (optional).
-        :param diameter: The diameter of the NEO in kilometers (optional).
+        :param diameter: The diameter of the NEO in kilometers, as a number or string (optional); `None` or an
+            empty string means unknown.
         :param hazardous: A boolean indicating if the NEO is potentially hazardous.
         """
         self.designation = designation
-        self.name = name if name else None
-        self.diameter = float(diameter) if diameter else float('nan')
+        self.name = name or None
+        self.diameter = _NAN if diameter is None or diameter == '' else float(diameter)
         self.hazardous = hazardous
         self.approaches = []
 
@@ -66,25 +74,59 @@ class CloseApproach:
     It also maintains a reference to the associated NEO.
     """
 
+    __slots__ = ('_designation', '_time', '_date_ord', 'distance', 'velocity', '_neo', '_serialized', '_time_str')
+
     def __init__(self, designation='', time=None, distance=0.0, velocity=0.0):
         """
         Initialize a new CloseApproach.
 
         :param designation: The unique identifier of the NEO.
-        :param time: The date and time, in UTC, at which the NEO approaches Earth.
+        :param time: The date and time, in UTC, at which the NEO approaches Earth, as a `datetime` or a NASA-formatted string.
         :param distance: The nominal approach distance in astronomical units.
         :param velocity: The relative approach velocity in kilometers per second.
         """
         self._designation = designation
-        self.time = cd_to_datetime(time) if time else None
+        if isinstance(time, datetime.datetime):
+            self.time = time
+        else:
+            self.time = cd_to_datetime(time) if time else None
         self.distance = float(distance)
         self.velocity = float(velocity)
         self.neo = None
 
+    @property
+    def time(self):
+        """Return the date and time, in UTC, at which the NEO approaches Earth."""
+        return self._time
+
+    @time.setter
+    def time(self, time):
+        """Set the approach time, keeping the values derived from it up to date."""
+        self._time = time
+        # The proleptic Gregorian ordinal of the approach date, so date filters compare ints
+        self._date_ord = time.toordinal() if time else 0
+        # Formatted again by `time_str` the next time it is needed
+        self._time_str = None
+        self._serialized = None
+
+    @property
+    def neo(self):
+        """Return the `NearEarthObject` making this close approach, if it has been linked."""
+        return self._neo
+
+    @neo.setter
+    def neo(self, neo):
+        """Link the close approach to its NEO, dropping any output row built for the previous one."""
+        self._neo = neo
+        # The flattened output row, filled in by `write` the first time it is needed
+        self._serialized = None
+
     @property
     def time_str(self):
-        """Return a formatted string representation of the approach time."""
-        return datetime_to_str(self.time)
+        """Return a formatted string representation of the approach time, formatting it only once."""
+        if self._time_str is None:
+            self._time_str = datetime_to_str(self.time)
+        return self._time_str
 
     def __str__(self):
         """Return a human-readable string representation of the close approach."""
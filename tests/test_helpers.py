@@ -0,0 +1,50 @@
+"""Check that `cd_to_datetime` parses NASA's calendar dates like `strptime` does.
+
+To run these tests from the project root, run:
+
+    $ python3 -m unittest --verbose tests.test_helpers
+
+`cd_to_datetime` parses well-formed dates from their fixed-width fields and hands
+anything else to `strptime`, so these tests cover both paths as well as inputs
+that neither accepts.
+"""
+import datetime
+import unittest
+
+from helpers import cd_to_datetime, datetime_to_str
+
+
+class TestCdToDatetime(unittest.TestCase):
+    def assertMatchesStrptime(self, calendar_date):
+        expected = datetime.datetime.strptime(calendar_date, "%Y-%b-%d %H:%M")
+        self.assertEqual(cd_to_datetime(calendar_date), expected)
+
+    def test_well_formed_dates(self):
+        self.assertEqual(cd_to_datetime('2020-Dec-31 12:00'), datetime.datetime(2020, 12, 31, 12, 0))
+        self.assertEqual(cd_to_datetime('1900-Jan-01 00:00'), datetime.datetime(1900, 1, 1, 0, 0))
+        self.assertEqual(cd_to_datetime('2020-Feb-29 23:59'), datetime.datetime(2020, 2, 29, 23, 59))
+        for month in ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'):
+            self.assertMatchesStrptime(f'2020-{month}-15 06:30')
+
+    def test_well_formed_dates_are_naive(self):
+        self.assertIsNone(cd_to_datetime('2020-Dec-31 12:00').tzinfo)
+
+    def test_dates_accepted_only_by_strptime(self):
+        self.assertMatchesStrptime('2020-Jan-1 00:00')
+        self.assertMatchesStrptime('2020-jan-01 00:00')
+        self.assertMatchesStrptime('2020-JAN-01 1:05')
+
+    def test_malformed_dates_are_rejected(self):
+        for calendar_date in ('2020-Foo-01 00:00', '2020-Jan-32 00:00', '2019-Feb-29 00:00',
+                              '2020-Jan-01 24:00', '2020-Jan-01T00:00', '2020-Jan-01 1230Z',
+                              '2020-Jan-01 00:00:00', '2020-01-01 00:00', '', 'x'):
+            with self.subTest(calendar_date=calendar_date):
+                with self.assertRaises(ValueError):
+                    cd_to_datetime(calendar_date)
+
+    def test_round_trip_through_datetime_to_str(self):
+        self.assertEqual(datetime_to_str(cd_to_datetime('2020-Mar-02 10:07')), '2020-03-02 10:07')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+"""Check how `NearEarthObject` normalizes the values it is constructed with.
+
+To run these tests from the project root, run:
+
+    $ python3 -m unittest --verbose tests.test_models
+"""
+import datetime
+import math
+import pathlib
+import unittest
+
+from extract import load_neos
+from models import NearEarthObject, CloseApproach, _NAN
+
+
+TESTS_ROOT = (pathlib.Path(__file__).parent).resolve()
+TEST_NEO_FILE = TESTS_ROOT / 'test-neos-2020.csv'
+
+
+class TestNearEarthObject(unittest.TestCase):
+    def test_missing_diameter_is_nan(self):
+        self.assertTrue(math.isnan(NearEarthObject(designation='2020 AB').diameter))
+        self.assertTrue(math.isnan(NearEarthObject(designation='2020 AB', diameter=None).diameter))
+        self.assertTrue(math.isnan(NearEarthObject(designation='2020 AB', diameter='').diameter))
+
+    def test_zero_diameter_is_kept(self):
+        neo = NearEarthObject(designation='2020 AB', diameter=0.0)
+        self.assertEqual(neo.diameter, 0.0)
+        self.assertFalse(math.isnan(neo.diameter))
+
+    def test_diameter_string_is_converted_to_float(self):
+        neo = NearEarthObject(designation='2020 AB', diameter='0.512')
+        self.assertIsInstance(neo.diameter, float)
+        self.assertEqual(neo.diameter, 0.512)
+
+    def test_missing_diameters_share_one_nan(self):
+        neos = [neo for neo in load_neos(TEST_NEO_FILE) if math.isnan(neo.diameter)]
+        self.assertGreater(len(neos), 0)
+        self.assertTrue(all(neo.diameter is _NAN for neo in neos))
+
+    def test_empty_name_is_none(self):
+        self.assertIsNone(NearEarthObject(designation='2020 AB', name='').name)
+        self.assertEqual(NearEarthObject(designation='2020 AB', name='Eros').name, 'Eros')
+
+
+class TestCloseApproach(unittest.TestCase):
+    def test_time_str_is_formatted_once(self):
+        approach = CloseApproach(designation='2020 AB', time='2020-Jan-01 12:30')
+        self.assertEqual(approach.time_str, '2020-01-01 12:30')
+        self.assertIs(approach.time_str, approach.time_str)
+
+    def test_time_str_follows_a_reassigned_time(self):
+        approach = CloseApproach(designation='2020 AB', time='2020-Jan-01 12:30')
+        self.assertEqual(approach.time_str, '2020-01-01 12:30')
+        approach.time = datetime.datetime(2021, 6, 15, 8, 5)
+        self.assertEqual(approach.time_str, '2021-06-15 08:05')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,12 +13,14 @@ To run these tests from the project root, run::
 These tests should pass when Tasks 3a and 3b are complete.
 """
 import datetime
+import operator
 import pathlib
+import random
 import unittest
 
-from database import NEODatabase
+from database import NEODatabase, _chain_filters
 from extract import load_neos, load_approaches
-from filters import create_filters
+from filters import create_filters, DateFilter, DistanceFilter, VelocityFilter, DiameterFilter, HazardousFilter
 
 
 TESTS_ROOT = (pathlib.Path(__file__).parent).resolve()
@@ -529,5 +531,143 @@ class TestQuery(unittest.TestCase):
         self.assertEqual(expected, received, msg="Computed results do not match expected results.")
 
 
+class TestQueryFilterCollections(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.neos = load_neos(TEST_NEO_FILE)
+        cls.approaches = load_approaches(TEST_CAD_FILE)
+        cls.db = NEODatabase(cls.neos, cls.approaches)
+
+    def test_query_with_empty_iterator_of_filters(self):
+        self.assertEqual(list(self.db.query(iter(()))), list(self.approaches))
+        self.assertEqual(list(self.db.query(f for f in ())), list(self.approaches))
+
+    def test_query_with_generator_of_filters(self):
+        filters = create_filters(date=datetime.date(2020, 3, 2), distance_max=0.4)
+        expected = list(self.db.query(filters))
+        self.assertGreater(len(expected), 0)
+        self.assertEqual(list(self.db.query(f for f in filters)), expected)
+
+    def test_chain_filters_without_filters_accepts_everything(self):
+        predicate = _chain_filters(())
+        self.assertTrue(all(predicate(approach) for approach in self.approaches))
+
+    def test_chain_filters_with_one_filter(self):
+        filters = create_filters(hazardous=True)
+        self.assertIs(_chain_filters(filters), filters[0])
+
+    def test_chain_filters_with_several_filters(self):
+        filters = create_filters(
+            start_date=datetime.date(2020, 3, 1), end_date=datetime.date(2020, 5, 31),
+            distance_max=0.5, velocity_min=5, diameter_max=1.5, hazardous=False
+        )
+        self.assertGreater(len(filters), 1)
+        predicate = _chain_filters(filters)
+        for approach in self.approaches:
+            self.assertEqual(predicate(approach), all(f(approach) for f in filters))
+
+
+class TestAttributeFilterClasses(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.neos = load_neos(TEST_NEO_FILE)
+        cls.approaches = load_approaches(TEST_CAD_FILE)
+        cls.db = NEODatabase(cls.neos, cls.approaches)
+
+    def assertFiltersMatch(self, filters, **criteria):
+        expected = list(self.db.query(create_filters(**criteria)))
+        self.assertGreater(len(expected), 0)
+        self.assertEqual(list(self.db.query(filters)), expected)
+
+    def test_date_filter_class(self):
+        date = datetime.date(2020, 3, 2)
+        self.assertFiltersMatch([DateFilter(operator.eq, date)], date=date)
+        self.assertFiltersMatch(
+            [DateFilter(operator.ge, datetime.date(2020, 3, 1)), DateFilter(operator.le, datetime.date(2020, 3, 31))],
+            start_date=datetime.date(2020, 3, 1), end_date=datetime.date(2020, 3, 31)
+        )
+
+    def test_date_filter_class_keeps_the_reference_date(self):
+        date = datetime.date(2020, 3, 2)
+        self.assertEqual(DateFilter(operator.eq, date).value, date)
+
+    def test_date_filter_get_returns_the_date_ordinal(self):
+        approach = self.approaches[0]
+        self.assertEqual(DateFilter.get(approach), approach.time.date().toordinal())
+
+    def test_numeric_filter_classes(self):
+        self.assertFiltersMatch(
+            [DistanceFilter(operator.le, 0.4), VelocityFilter(operator.ge, 5)],
+            distance_max=0.4, velocity_min=5
+        )
+        self.assertFiltersMatch(
+            [DiameterFilter(operator.ge, 0.1), HazardousFilter(operator.eq, True)],
+            diameter_min=0.1, hazardous=True
+        )
+
+    def test_date_filters_follow_a_reassigned_time(self):
+        approach = load_approaches(TEST_CAD_FILE)[0]
+        approach.time = datetime.datetime(2021, 6, 15, 12, 30)
+        date = datetime.date(2021, 6, 15)
+        self.assertTrue(all(f(approach) for f in create_filters(date=date)))
+        self.assertTrue(DateFilter(operator.eq, date)(approach))
+        self.assertFalse(DateFilter(operator.eq, date - datetime.timedelta(days=1))(approach))
+
+
+class TestQueryVectorized(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.neos = load_neos(TEST_NEO_FILE)
+        cls.approaches = load_approaches(TEST_CAD_FILE)
+        cls.db = NEODatabase(cls.neos, cls.approaches)
+
+    def assertMatchesQuery(self, **criteria):
+        # `query_vectorized` produces results in date order, so compare against a stable sort of `query`.
+        expected = sorted(self.db.query(create_filters(**criteria)), key=lambda approach: approach.time.date())
+        received = list(self.db.query_vectorized(**criteria))
+        self.assertEqual(expected, received, msg="Computed results do not match expected results.")
+
+    def test_query_vectorized_all(self):
+        self.assertMatchesQuery()
+
+    def test_query_vectorized_approaches_on_march_2(self):
+        self.assertMatchesQuery(date=datetime.date(2020, 3, 2))
+
+    def test_query_vectorized_with_conflicting_date_bounds(self):
+        self.assertMatchesQuery(start_date=datetime.date(2020, 10, 1), end_date=datetime.date(2020, 4, 1))
+
+    def test_query_vectorized_with_distance_and_velocity_bounds(self):
+        self.assertMatchesQuery(distance_min=0.05, distance_max=0.5, velocity_min=5, velocity_max=25)
+
+    def test_query_vectorized_with_diameter_bounds_and_hazardous(self):
+        self.assertMatchesQuery(diameter_min=0.1, diameter_max=1.5, hazardous=True)
+        self.assertMatchesQuery(diameter_min=0.1, diameter_max=1.5, hazardous=False)
+
+    def test_query_vectorized_in_spring_with_all_bounds(self):
+        self.assertMatchesQuery(
+            start_date=datetime.date(2020, 3, 1), end_date=datetime.date(2020, 5, 31),
+            distance_min=0.05, distance_max=0.5,
+            velocity_min=5, velocity_max=25,
+            diameter_min=0.5, diameter_max=1.5,
+            hazardous=False
+        )
+
+
+class TestQueryVectorizedUnsorted(TestQueryVectorized):
+    """Rerun the `query_vectorized` tests on a database whose approaches are not in date order."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.neos = load_neos(TEST_NEO_FILE)
+        cls.approaches = load_approaches(TEST_CAD_FILE)
+        random.Random(2020).shuffle(cls.approaches)
+        cls.db = NEODatabase(cls.neos, cls.approaches)
+
+    def test_query_vectorized_results_are_in_date_order(self):
+        dates = [approach.time.date() for approach in self.db.query_vectorized()]
+        self.assertEqual(dates, sorted(dates))
+        self.assertNotEqual(list(self.db.query_vectorized()), list(self.db.query(create_filters())))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -27,6 +27,7 @@ import unittest.mock
 
 from extract import load_neos, load_approaches
 from database import NEODatabase
+from models import NearEarthObject
 from write import write_to_csv, write_to_json
 
 
@@ -226,5 +227,48 @@ class TestWriteToJSON(unittest.TestCase):
         self.assertIsInstance(approach['neo']['potentially_hazardous'], bool)
 
 
+class TestWriteAfterRelinking(unittest.TestCase):
+    @unittest.mock.patch('write.open')
+    def write_csv_rows(self, results, mock_file):
+        with UncloseableStringIO() as buf:
+            mock_file.return_value = buf
+            write_to_csv(results, None)
+            buf.seek(0)
+            return list(csv.DictReader(buf))
+
+    @unittest.mock.patch('write.open')
+    def write_json_records(self, results, mock_file):
+        with UncloseableStringIO() as buf:
+            mock_file.return_value = buf
+            write_to_json(results, None)
+            buf.seek(0)
+            return json.load(buf)
+
+    def test_csv_row_follows_a_reassigned_neo(self):
+        results = build_results(1)
+        original = results[0].neo
+        self.assertEqual(self.write_csv_rows(results)[0]['designation'], original.designation)
+
+        results[0].neo = NearEarthObject(designation='2099 ZZ', name='Relinked', diameter=1.25, hazardous=True)
+        row = self.write_csv_rows(results)[0]
+        self.assertEqual(row['designation'], '2099 ZZ')
+        self.assertEqual(row['name'], 'Relinked')
+        self.assertEqual(float(row['diameter_km']), 1.25)
+        self.assertEqual(row['potentially_hazardous'], 'True')
+
+    def test_json_record_follows_a_reassigned_neo_and_time(self):
+        results = build_results(1)
+        self.write_json_records(results)
+
+        results[0].neo = NearEarthObject(designation='2099 ZZ', name='Relinked', diameter=1.25, hazardous=True)
+        results[0].time = datetime.datetime(2099, 12, 31, 23, 59)
+        record = self.write_json_records(results)[0]
+        self.assertEqual(record['datetime_utc'], '2099-12-31 23:59')
+        self.assertEqual(record['neo']['designation'], '2099 ZZ')
+        self.assertEqual(record['neo']['name'], 'Relinked')
+        self.assertEqual(record['neo']['diameter_km'], 1.25)
+        self.assertIs(record['neo']['potentially_hazardous'], True)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -7,6 +7,24 @@ The primary functions in this module are `write_to_csv` and `write_to_json`. The
 import csv
 import json
 
+def _row(approach):
+    """
+    Return the flattened output row for a `CloseApproach`, computing it only once.
+
+    The row holds the approach's time string, distance and velocity, followed by its NEO's designation, name,
+    diameter and hazardous status, in the order of the CSV columns.
+
+    :param approach: A `CloseApproach` linked to its NEO.
+    :return: A tuple of the approach's output values.
+    """
+    row = approach._serialized
+    if row is None:
+        neo = approach.neo
+        row = (approach.time_str, approach.distance, approach.velocity,
+               neo.designation, neo.name, neo.diameter, neo.hazardous)
+        approach._serialized = row
+    return row
+
 def write_to_csv(results, filename):
     """
     Write an iterable of `CloseApproach` objects to a CSV file.
@@ -22,18 +40,9 @@ def write_to_csv(results, filename):
     )
 
     with open(filename, 'w', newline='') as file:
-        writer = csv.DictWriter(file, fieldnames=fieldnames)
-        writer.writeheader()
-        for approach in results:
-            writer.writerow({
-                'datetime_utc': approach.time_str,
-                'distance_au': approach.distance,
-                'velocity_km_s': approach.velocity,
-                'designation': approach.neo.designation,
-                'name': approach.neo.name,
-                'diameter_km': approach.neo.diameter,
-                'potentially_hazardous': approach.neo.hazardous
-            })
+        writer = csv.writer(file)
+        writer.writerow(fieldnames)
+        writer.writerows(map(_row, results))
 
 def write_to_json(results, filename):
     """
@@ -44,19 +53,24 @@ def write_to_json(results, filename):
     :param results: An iterable of `CloseApproach` objects.
     :param filename: The desired location and name of the output file.
     """
-    output = []
-    for approach in results:
-        output.append({
-            'datetime_utc': approach.time_str,
-            'distance_au': approach.distance,
-            'velocity_km_s': approach.velocity,
-            'neo': {
-                'designation': approach.neo.designation,
-                'name': approach.neo.name,
-                'diameter_km': approach.neo.diameter,
-                'potentially_hazardous': approach.neo.hazardous
-            }
-        })
-
     with open(filename, 'w') as file:
-        json.dump(output, file, indent=2)
\ No newline at end of file
+        # Encode one approach at a time rather than building the whole list first.
+        file.write('[')
+        separator = '\n  '
+        for approach in results:
+            time_str, distance, velocity, designation, name, diameter, hazardous = _row(approach)
+            record = json.dumps({
+                'datetime_utc': time_str,
+                'distance_au': distance,
+                'velocity_km_s': velocity,
+                'neo': {
+                    'designation': designation,
+                    'name': name,
+                    'diameter_km': diameter,
+                    'potentially_hazardous': hazardous
+                }
+            }, indent=2)
+            file.write(separator)
+            file.write(record.replace('\n', '\n  '))
+            separator = ',\n  '
+        file.write('\n]' if separator != '\n  ' else ']')